@@ -1,7 +1,5 @@
 import streamlit as st
 import os
-import tempfile
-import shutil
 from latex_converter import LatexConverter
 
 def main():
@@ -49,47 +47,34 @@ def main():
         if st.button("Convert to LaTeX"):
             with st.spinner("Converting..."):
                 try:
-                    # Create a temporary directory to handle files
-                    with tempfile.TemporaryDirectory() as tmpdirname:
-                        # Save uploaded file to temp dir
-                        input_path = os.path.join(tmpdirname, uploaded_file.name)
-                        with open(input_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-                        
-                        # Define output path
-                        output_filename = os.path.splitext(uploaded_file.name)[0] + ".tex"
-                        output_path = os.path.join(tmpdirname, output_filename)
-                        
-                        # Prepare options
-                        options = {
-                            "doc_class": doc_class,
-                            "fontsize": fontsize,
-                            "margins": margins,
-                            "packages": packages,
-                            "custom_preamble": custom_preamble
-                        }
-                        
-                        # Run conversion
-                        converter = LatexConverter(input_path, output_path, options)
-                        converter.convert()
-                        
-                        # Read the generated LaTeX file
-                        with open(output_path, "r", encoding="utf-8") as f:
-                            latex_content = f.read()
-                        
-                        st.success("Conversion successful!")
-                        
-                        # Display preview (first 500 chars)
-                        with st.expander("Preview LaTeX Code"):
-                            st.code(latex_content, language="latex")
-                        
-                        # Download button
-                        st.download_button(
-                            label="Download .tex file",
-                            data=latex_content,
-                            file_name=output_filename,
-                            mime="text/x-tex"
-                        )
+                    output_filename = os.path.splitext(uploaded_file.name)[0] + ".tex"
+                    
+                    # Prepare options
+                    options = {
+                        "doc_class": doc_class,
+                        "fontsize": fontsize,
+                        "margins": margins,
+                        "packages": packages,
+                        "custom_preamble": custom_preamble
+                    }
+                    
+                    # Run conversion in memory, without temporary files
+                    converter = LatexConverter.from_bytes(uploaded_file.getbuffer(), uploaded_file.name, options)
+                    latex_content = converter.convert_to_string()
+                    
+                    st.success("Conversion successful!")
+                    
+                    # Display preview (first 500 chars)
+                    with st.expander("Preview LaTeX Code"):
+                        st.code(latex_content, language="latex")
+                    
+                    # Download button
+                    st.download_button(
+                        label="Download .tex file",
+                        data=latex_content,
+                        file_name=output_filename,
+                        mime="text/x-tex"
+                    )
                         
                 except Exception as e:
                     st.error(f"An error occurred during conversion: {e}")
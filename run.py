@@ -2,62 +2,341 @@ import os
 import sys
 import re
 import argparse
-import docx
-import pdfplumber
-from docx.document import Document as _Document
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
-
-class LatexConverter:
-    def __init__(self, input_path, output_path, options):
-        self.input_path = input_path
-        self.output_path = output_path
-        self.options = options
-        self.content = ""
-
-    def _escape_latex(self, text):
-        """Escapes special LaTeX characters in plain text."""
-        if not text:
-            return ""
-        chars = {
-            '&': r'\&',
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-            '^': r'\^{}',
-            '\\': r'\textbackslash{}',
-        }
-        pattern = re.compile('|'.join(re.escape(key) for key in chars.keys()))
-        return pattern.sub(lambda x: chars[x.group()], text)
+import hashlib
+import html
+import io
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache
+
+# Special LaTeX characters and their escaped forms
+_ESCAPE_CHARS = {
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\^{}',
+    '\\': r'\textbackslash{}',
+}
 
-    def _get_preamble(self):
-        """Generates the LaTeX preamble based on options."""
-        packages = [
-            "geometry", "graphicx", "hyperref", "amsmath", 
-            "listings", "xcolor", "booktabs", "float"
-        ]
-        
-        # Add custom packages
-        if self.options.get('packages'):
-            packages.extend(self.options.get('packages').split(','))
-
-        preamble = [
-            f"\\documentclass[{self.options.get('fontsize', '12pt')}]{{{self.options.get('doc_class', 'article')}}}",
-            f"\\usepackage[{self.options.get('margins', 'margin=1in')}]{{geometry}}",
-        ]
-        
-        for pkg in packages:
-            preamble.append(f"\\usepackage{{{pkg.strip()}}}")
+# A character class takes the regex engine's fast single-char path, unlike
+# an alternation of the individual characters
+_ESCAPE_RE = re.compile(r'[&%$#_{}~^\\]')
+_SPECIAL_CHARS = frozenset(_ESCAPE_CHARS)
+
+def _escape_repl(match):
+    return _ESCAPE_CHARS[match.group()]
+
+def _escape(text):
+    """Escapes special LaTeX characters in plain text."""
+    return _ESCAPE_RE.sub(_escape_repl, text)
+
+def _code_block_repl(match):
+    code = match.group(1)
+    return f"\\begin{{lstlisting}}\n{code}\n\\end{{lstlisting}}"
+
+# Inline code and bold / italic spans. ***x*** is bold italic. An italic span
+# may contain bold ones (including one right at its start, as in ***a** b*),
+# and it is tried before bold so that case is not read as bold; otherwise
+# neither its opening nor its closing `*` may be half of a `**`.
+_MD_SPAN_PATTERN = (
+    r'`(?P<code>[^`]+)`'
+    r'|\*\*\*(?P<bolditalic>.+?)\*\*\*'
+    r'|\*(?:(?!\*)|(?=\*\*(?!\*)))(?P<italic>(?:\*\*.*?\*\*|[^*\n])*?)\*(?!\*)'
+    r'|\*\*(?P<bold>.*?)\*\*'
+)
+_MD_SPAN_RE = re.compile(_MD_SPAN_PATTERN)
+
+# Headers share one pattern with the spans so the document is scanned once;
+# the named group that matched selects the LaTeX command.
+_MD_INLINE_RE = re.compile(
+    r'^### (?P<h3>.*)'
+    r'|^## (?P<h2>.*)'
+    r'|^# (?P<h1>.*)'
+    r'|' + _MD_SPAN_PATTERN,
+    re.MULTILINE,
+)
+_MD_INLINE_COMMANDS = {
+    'code': 'texttt',
+    'h3': 'subsubsection',
+    'h2': 'subsection',
+    'h1': 'section',
+    'bold': 'textbf',
+    'italic': 'textit',
+}
 
-        # Basic setup for code blocks
-        preamble.append(
-            r"""
+def _md_inline_repl(match):
+    kind = match.lastgroup
+    text = match.group(kind)
+    # Headers and emphasis may contain further spans (but not headers); code is literal
+    if kind != 'code':
+        text = _MD_SPAN_RE.sub(_md_inline_repl, text)
+    if kind == 'bolditalic':
+        return f"\\textbf{{\\textit{{{text}}}}}"
+    return f"\\{_MD_INLINE_COMMANDS[kind]}{{{text}}}"
+
+# Patterns are compiled once per process rather than on every call.
+# Markdown -> LaTeX substitutions are applied in order; code blocks need their
+# own DOTALL pass and go first to avoid conflicts with the inline rules.
+_MD_PIPELINE = [
+    (re.compile(r'```(.*?)```', re.DOTALL), _code_block_repl),
+    (_MD_INLINE_RE, _md_inline_repl),
+]
+_LIST_LINE_RE = re.compile(r'^\s*-\s+')
+
+_SECTION_COMMANDS = {1: "section", 2: "subsection", 3: "subsubsection"}
+
+# Raw HTML in Markdown: tags are dropped, except line breaks which map to \\
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_HTML_BREAK_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+
+def _html_text_to_latex(text):
+    """Decodes HTML entities (left in place in mistune text tokens) and escapes the result."""
+    return _escape(html.unescape(text))
+
+# LaTeX commands written directly in Markdown text, e.g. \ref{fig:1}
+_LATEX_COMMAND_RE = re.compile(r'\\[A-Za-z]+\*?(?:\[[^\]]*\])?(?:\{[^{}]*\})*')
+
+def _markdown_text_to_latex(text):
+    """Escapes Markdown text but passes embedded LaTeX commands through."""
+    parts = []
+    pos = 0
+    for command in _LATEX_COMMAND_RE.finditer(text):
+        parts.append(_html_text_to_latex(text[pos:command.start()]))
+        parts.append(command.group())
+        pos = command.end()
+    parts.append(_html_text_to_latex(text[pos:]))
+    return "".join(parts)
+
+def _html_to_latex(raw):
+    """Converts a fragment of raw HTML to LaTeX, keeping only its text."""
+    parts = []
+    pos = 0
+    for tag in _HTML_TAG_RE.finditer(raw):
+        parts.append(_html_text_to_latex(raw[pos:tag.start()]))
+        if _HTML_BREAK_RE.fullmatch(tag.group()):
+            parts.append("\\\\\n")
+        pos = tag.end()
+    parts.append(_html_text_to_latex(raw[pos:]))
+    return "".join(parts)
+
+# Heavy format libraries are imported on first use so that, e.g., converting
+# a .txt file never pays for PyMuPDF. The loaders are cached so a missing
+# optional dependency is only probed once.
+
+@lru_cache(maxsize=None)
+def _import_fitz():
+    """Returns PyMuPDF (C-backed, preferred for PDFs) or None if not installed."""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+@lru_cache(maxsize=None)
+def _import_mistune():
+    """Returns mistune or None if not installed."""
+    try:
+        import mistune
+    except ImportError:
+        return None
+    return mistune
+
+@lru_cache(maxsize=None)
+def _markdown_renderer():
+    """Returns a mistune Markdown -> LaTeX renderer, or None if mistune is
+    not installed, in which case the regex pipeline is used as a fallback."""
+    mistune = _import_mistune()
+    if mistune is None:
+        return None
+
+    class LatexRenderer(mistune.HTMLRenderer):
+        """Renders the mistune token stream as LaTeX instead of HTML."""
+        NAME = 'latex'
+
+        def text(self, text):
+            return _markdown_text_to_latex(text)
+
+        def emphasis(self, text):
+            return f"\\textit{{{text}}}"
+
+        def strong(self, text):
+            return f"\\textbf{{{text}}}"
+
+        def link(self, text, url, title=None):
+            url = url.replace('%', r'\%').replace('#', r'\#')
+            return f"\\href{{{url}}}{{{text}}}"
+
+        def image(self, text, url, title=None):
+            return f"\\includegraphics{{{url}}}"
+
+        def inline_math(self, text):
+            return f"${text}$"
+
+        def block_math(self, text):
+            return f"\\[\n{text}\n\\]\n\n"
+
+        def codespan(self, text):
+            return f"\\texttt{{{_escape(text)}}}"
+
+        def linebreak(self):
+            return "\\\\\n"
+
+        def softbreak(self):
+            return "\n"
+
+        def inline_html(self, raw):
+            return _html_to_latex(raw)
+
+        def paragraph(self, text):
+            return f"{text}\n\n"
+
+        def heading(self, text, level, **attrs):
+            command = _SECTION_COMMANDS.get(level, "paragraph")
+            return f"\\{command}{{{text}}}\n\n"
+
+        def thematic_break(self):
+            return "\\noindent\\rule{\\linewidth}{0.4pt}\n\n"
+
+        def block_code(self, code, info=None):
+            return f"\\begin{{lstlisting}}\n{code}\\end{{lstlisting}}\n\n"
+
+        def block_quote(self, text):
+            return f"\\begin{{quote}}\n{text}\\end{{quote}}\n\n"
+
+        def block_html(self, raw):
+            return f"{_html_to_latex(raw).strip()}\n\n"
+
+        def list(self, text, ordered, **attrs):
+            env = "enumerate" if ordered else "itemize"
+            return f"\\begin{{{env}}}\n{text}\\end{{{env}}}\n\n"
+
+        def list_item(self, text):
+            return f"\\item {text.strip()}\n"
+
+    # Math is emitted verbatim instead of being escaped as text
+    return mistune.create_markdown(renderer=LatexRenderer(), plugins=['math'])
+
+# WordprocessingML tags, in ElementTree's {namespace}tag form
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_T = f'{_W_NS}t'
+_W_TAB = f'{_W_NS}tab'
+_W_BR = f'{_W_NS}br'
+_W_CR = f'{_W_NS}cr'
+_W_HYPERLINK = f'{_W_NS}hyperlink'
+_W_TBL = f'{_W_NS}tbl'
+_W_TR = f'{_W_NS}tr'
+_W_TC = f'{_W_NS}tc'
+_W_VAL = f'{_W_NS}val'
+_W_STYLE = f'{_W_NS}style'
+_W_STYLE_ID = f'{_W_NS}styleId'
+_W_NAME = f'{_W_NS}name'
+_W_RPR = f'{_W_NS}rPr'
+_W_B = f'{_W_NS}b'
+_W_I = f'{_W_NS}i'
+_W_PSTYLE_PATH = f'{_W_NS}pPr/{_W_NS}pStyle'
+_W_GRID_COL_PATH = f'{_W_NS}tblGrid/{_W_NS}gridCol'
+_W_GRID_SPAN_PATH = f'{_W_NS}tcPr/{_W_NS}gridSpan'
+_W_VMERGE_PATH = f'{_W_NS}tcPr/{_W_NS}vMerge'
+
+def _is_on(prop):
+    """Reads a WordprocessingML toggle property such as <w:b/>."""
+    return prop is not None and prop.get(_W_VAL) not in ('0', 'false', 'off')
+
+def _docx_runs(para):
+    """Yields the runs of a paragraph, including those inside hyperlinks."""
+    for child in para:
+        if child.tag == _W_R:
+            yield child
+        elif child.tag == _W_HYPERLINK:
+            yield from child.iterfind(_W_R)
+
+def _docx_run_text(run):
+    parts = []
+    for child in run:
+        if child.tag == _W_T:
+            parts.append(child.text or "")
+        elif child.tag == _W_TAB:
+            parts.append("\t")
+        elif child.tag in (_W_BR, _W_CR):
+            parts.append("\n")
+    return "".join(parts)
+
+def _docx_paragraph_text(para):
+    return "".join(_docx_run_text(run) for run in _docx_runs(para))
+
+def _docx_table_rows(table):
+    """Yields the cell texts of each table row, one per grid column.
+
+    As in python-docx, a horizontally merged cell is repeated across its
+    span and a vertically merged cell repeats the text of the cell above.
+    """
+    above = []
+    for row in table.iterfind(_W_TR):
+        cells = []
+        for cell in row.iterfind(_W_TC):
+            col = len(cells)
+            merge = cell.find(_W_VMERGE_PATH)
+            if merge is not None and merge.get(_W_VAL, 'continue') == 'continue' and col < len(above):
+                text = above[col]
+            else:
+                text = "\n".join(_docx_paragraph_text(p) for p in cell.iterfind(_W_P))
+            span = cell.find(_W_GRID_SPAN_PATH)
+            cells.extend([text] * (int(span.get(_W_VAL, 1)) if span is not None else 1))
+        yield cells
+        above = cells
+
+def _load_docx_styles(archive):
+    """Maps paragraph style ids to their lower-cased display names."""
+    try:
+        with archive.open('word/styles.xml') as fp:
+            root = ET.parse(fp).getroot()
+    except KeyError:
+        return {}
+
+    styles = {}
+    for style in root.iterfind(_W_STYLE):
+        name = style.find(_W_NAME)
+        if name is not None:
+            styles[style.get(_W_STYLE_ID)] = name.get(_W_VAL, "").lower()
+    return styles
+
+def _source_version():
+    """Hashes this module's source so any parser change invalidates the disk cache."""
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return "unversioned"
+
+# Parsed bodies of files converted from a path are cached on disk, keyed by
+# input hash and parser backend, in a folder per source version. The cache is
+# capped by entry count and age.
+_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "latex_converter")
+_CACHE_DIR = os.path.join(_CACHE_ROOT, _source_version())
+_CACHE_MAX_ENTRIES = 256
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_DEFAULT_PACKAGES = (
+    "geometry", "graphicx", "hyperref", "amsmath", 
+    "listings", "xcolor", "booktabs", "float"
+)
+
+# Basic setup for code blocks
+_LSTSET = r"""
 \lstset{
     basicstyle=\ttfamily\small,
     breaklines=true,
@@ -68,18 +347,118 @@ class LatexConverter:
     stringstyle=\color{red}
 }
             """
-        )
 
-        if self.options.get('custom_preamble'):
-            preamble.append(self.options.get('custom_preamble'))
+@lru_cache(maxsize=16)
+def _build_preamble(doc_class, fontsize, margins, packages, custom_preamble, title):
+    """Builds the preamble text; identical options reuse the cached result."""
+    preamble = [
+        f"\\documentclass[{fontsize}]{{{doc_class}}}",
+        f"\\usepackage[{margins}]{{geometry}}",
+    ]
+    preamble.extend(f"\\usepackage{{{pkg}}}" for pkg in _DEFAULT_PACKAGES)
+    
+    # Add custom packages
+    if packages:
+        preamble.extend(f"\\usepackage{{{pkg.strip()}}}" for pkg in packages.split(','))
 
-        preamble.append(f"\\title{{{os.path.basename(self.input_path)}}}")
-        preamble.append("\\author{Auto-Generated}")
-        preamble.append("\\date{\\today}")
-        preamble.append("\\begin{document}")
-        preamble.append("\\maketitle")
-        
-        return "\n".join(preamble)
+    preamble.append(_LSTSET)
+
+    if custom_preamble:
+        preamble.append(custom_preamble)
+
+    preamble.append(f"\\title{{{title}}}")
+    preamble.append("\\author{Auto-Generated}")
+    preamble.append("\\date{\\today}")
+    preamble.append("\\begin{document}")
+    preamble.append("\\maketitle")
+    
+    return "\n".join(preamble)
+
+# Most recently used parsed bodies, keyed by (digest, ext, backend). Kept by hand rather
+# than with lru_cache so that in-memory inputs are not held by the cache keys.
+_BODY_CACHE = OrderedDict()
+_BODY_CACHE_SIZE = 32
+_BODY_CACHE_LOCK = threading.Lock()
+
+# Line breaks inside a PDF paragraph become spaces; blank lines separate paragraphs
+_NEWLINE_TABLE = str.maketrans({'\n': ' '})
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+# PDFs shorter than this are extracted in-process: starting a spawn pool costs
+# ~0.3 s (each worker re-imports PyMuPDF) against ~2.5 ms per page sequentially
+_PARALLEL_PDF_MIN_PAGES = 200
+# With this few cores the pool never pays for its start-up
+_PARALLEL_PDF_MIN_CPUS = 3
+
+def _open_pdf(source):
+    """Opens a PDF with PyMuPDF from a path or from in-memory bytes."""
+    fitz = _import_fitz()
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype='pdf')
+    return fitz.open(source)
+
+# The PDF (path or bytes) a pool worker extracts from. Set once per worker by
+# the pool initializer so in-memory uploads are not re-sent with every chunk.
+_WORKER_PDF_SOURCE = None
+
+def _init_pdf_worker(source):
+    global _WORKER_PDF_SOURCE
+    _WORKER_PDF_SOURCE = source
+
+def _extract_pages(start, end):
+    """Extracts the text of pages [start, end) of a PDF.
+
+    Runs in a worker process, so it opens its own document (fitz objects
+    cannot be pickled).
+    """
+    with _open_pdf(_WORKER_PDF_SOURCE) as doc:
+        return [doc[i].get_text("text") for i in range(start, end)]
+
+class LatexConverter:
+    def __init__(self, input_path, output_path, options):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.options = options
+        self.content = ""
+        # Raw file contents when converting from memory instead of a path
+        self.data = None
+
+    @classmethod
+    def from_bytes(cls, data, filename, options):
+        """Creates a converter for in-memory file contents.
+
+        `filename` is only used for its extension and the document title.
+        """
+        converter = cls(filename, None, options)
+        converter.data = bytes(data)
+        return converter
+
+    def _source(self):
+        """Returns something the format libraries can open: a path or a stream."""
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return self.input_path
+
+    def _read_text(self):
+        if self.data is not None:
+            return self.data.decode('utf-8')
+        with open(self.input_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _escape_latex(self, text):
+        """Escapes special LaTeX characters in plain text."""
+        return _escape(text) if text else ""
+
+    def _get_preamble(self):
+        """Generates the LaTeX preamble based on options."""
+        return _build_preamble(
+            self.options.get('doc_class', 'article'),
+            self.options.get('fontsize', '12pt'),
+            self.options.get('margins', 'margin=1in'),
+            self.options.get('packages'),
+            self.options.get('custom_preamble'),
+            os.path.basename(self.input_path),
+        )
 
     def _get_postamble(self):
         return "\n\\end{document}"
@@ -90,147 +469,189 @@ class LatexConverter:
     def parse_docx(self):
         """Parses DOCX extracting text, styles, lists, and tables."""
         try:
-            doc = docx.Document(self.input_path)
             latex_body = []
-            
-            # Helper to iterate over document elements in order (paragraphs and tables)
-            def iter_block_items(parent):
-                if isinstance(parent, _Document):
-                    parent_elm = parent.element.body
-                elif isinstance(parent, _Cell):
-                    parent_elm = parent._tc
-                else:
-                    raise ValueError("something's not right")
-
-                for child in parent_elm.iterchildren():
-                    if isinstance(child, CT_P):
-                        yield Paragraph(child, parent)
-                    elif isinstance(child, CT_Tbl):
-                        yield Table(child, parent)
-
-            for block in iter_block_items(doc):
-                if isinstance(block, Paragraph):
-                    latex_body.append(self._process_docx_paragraph(block))
-                elif isinstance(block, Table):
-                    latex_body.append(self._process_docx_table(block))
+            # Consecutive list paragraphs are collected into one itemize
+            list_items = []
+
+            def flush_list():
+                if list_items:
+                    latex_body.append("\\begin{itemize}\n" + "\n".join(list_items) + "\n\\end{itemize}")
+                    list_items.clear()
+
+            with zipfile.ZipFile(self._source()) as archive:
+                styles = _load_docx_styles(archive)
+                
+                # Stream document.xml, handling each body-level paragraph or
+                # table as soon as it is complete and then discarding it
+                depth = 0
+                with archive.open('word/document.xml') as fp:
+                    for event, elem in ET.iterparse(fp, events=('start', 'end')):
+                        if event == 'start':
+                            depth += 1
+                            continue
+                        depth -= 1
+                        # w:document > w:body > block
+                        if depth != 2:
+                            continue
+                        if elem.tag == _W_P:
+                            kind, text = self._process_docx_paragraph(elem, styles)
+                            if kind == 'item':
+                                list_items.append(f"\\item {text}")
+                            elif kind == 'block':
+                                flush_list()
+                                latex_body.append(text)
+                        elif elem.tag == _W_TBL:
+                            flush_list()
+                            latex_body.append(self._process_docx_table(elem))
+                        elem.clear()
+            flush_list()
             
             self.content = "\n\n".join(filter(None, latex_body))
         except Exception as e:
             raise RuntimeError(f"Error parsing DOCX: {e}")
 
-    def _process_docx_paragraph(self, para):
-        if not para.text.strip():
-            return ""
+    def _process_docx_paragraph(self, para, styles):
+        """Returns a (kind, latex) pair where kind is 'item' for list
+        paragraphs, 'block' for everything else and None for empty ones."""
+        runs = [(_docx_run_text(run), run) for run in _docx_runs(para)]
+        if not any(run_text.strip() for run_text, _ in runs):
+            return None, ""
 
-        text = ""
+        parts = []
         # Handle runs for bold/italic
-        for run in para.runs:
-            escaped_text = self._escape_latex(run.text)
-            if run.bold:
-                escaped_text = f"\\textbf{{{escaped_text}}}"
-            if run.italic:
-                escaped_text = f"\\textit{{{escaped_text}}}"
-            text += escaped_text
-
-        style_name = para.style.name.lower()
+        for run_text, run in runs:
+            # Runs are short and usually plain, so a set check beats the regex
+            if _SPECIAL_CHARS.isdisjoint(run_text):
+                escaped_text = run_text
+            else:
+                escaped_text = _escape(run_text)
+            # Unformatted runs have no w:rPr and need no wrapping
+            props = run.find(_W_RPR)
+            if props is not None:
+                if _is_on(props.find(_W_B)):
+                    escaped_text = f"\\textbf{{{escaped_text}}}"
+                if _is_on(props.find(_W_I)):
+                    escaped_text = f"\\textit{{{escaped_text}}}"
+            parts.append(escaped_text)
+        text = "".join(parts)
+
+        style = para.find(_W_PSTYLE_PATH)
+        style_id = style.get(_W_VAL) if style is not None else None
+        style_name = styles.get(style_id, (style_id or "").lower())
         
         if 'heading 1' in style_name:
-            return f"\\section{{{text}}}"
+            return 'block', f"\\section{{{text}}}"
         elif 'heading 2' in style_name:
-            return f"\\subsection{{{text}}}"
+            return 'block', f"\\subsection{{{text}}}"
         elif 'heading 3' in style_name:
-            return f"\\subsubsection{{{text}}}"
+            return 'block', f"\\subsubsection{{{text}}}"
         elif 'list' in style_name or 'bullet' in style_name:
-            # Simple handling of lists (grouping logic omitted for brevity, treating as itemize)
-            return f"\\begin{{itemize}}\n\\item {text}\n\\end{{itemize}}"
+            return 'item', text
         else:
-            return f"{text}\n"
+            return 'block', f"{text}\n"
 
     def _process_docx_table(self, table):
-        rows = []
-        num_cols = len(table.columns)
+        num_cols = len(table.findall(_W_GRID_COL_PATH))
         col_spec = "|" + "l|" * num_cols
+        terminator = " \\\\ \\hline"
         
-        for row in table.rows:
-            cells = [self._escape_latex(cell.text.strip()) for cell in row.cells]
-            rows.append(" & ".join(cells) + " \\\\ \\hline")
-        
-        table_content = "\n".join(rows)
+        table_content = "\n".join(
+            " & ".join(_escape(text.strip()) for text in cells) + terminator
+            for cells in _docx_table_rows(table)
+        )
         return f"\\begin{{table}}[H]\n\\centering\n\\begin{{tabular}}{{{col_spec}}}\n\\hline\n{table_content}\n\\end{{tabular}}\n\\end{{table}}"
 
     # ==========================
     # PDF HANDLING
     # ==========================
     def parse_pdf(self):
-        """Extracts text from PDF using pdfplumber."""
+        """Extracts text from PDF using PyMuPDF (or pdfplumber as a fallback)."""
         try:
             text_content = []
-            with pdfplumber.open(self.input_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        # Clean up some common PDF extraction artifacts
-                        clean_text = self._escape_latex(text)
-                        text_content.append(clean_text)
+            for text in self._extract_pdf_pages():
+                if text and text.strip():
+                    # Basic reflow: join wrapped lines but keep blank-line
+                    # paragraph breaks
+                    paragraphs = _PARAGRAPH_BREAK_RE.split(text.strip())
+                    text_content.append("\n\n".join(p.translate(_NEWLINE_TABLE) for p in paragraphs))
             
             if not text_content:
                 print("Warning: No text extracted. PDF might be scanned/image-only.")
                 self.content = "% [WARNING: No text extracted from PDF]"
             else:
-                # Treat double newlines as paragraphs
-                full_text = "\n\n".join(text_content)
-                self.content = full_text.replace("\n", " ") # Basic reflow
+                # Each page starts a new paragraph; escape the whole body in one pass
+                self.content = self._escape_latex("\n\n".join(text_content))
                 
         except Exception as e:
             raise RuntimeError(f"Error parsing PDF: {e}")
 
+    def _extract_pdf_pages(self):
+        """Returns the raw text of each PDF page."""
+        if _import_fitz() is not None:
+            source = self.data if self.data is not None else self.input_path
+            with _open_pdf(source) as doc:
+                num_pages = doc.page_count
+                if num_pages < _PARALLEL_PDF_MIN_PAGES or (os.cpu_count() or 1) < _PARALLEL_PDF_MIN_CPUS:
+                    return [page.get_text("text") for page in doc]
+
+            # Oversubscribe the cores so workers waiting on I/O don't leave them idle
+            num_chunks = min(num_pages, max(1, (os.cpu_count() or 1) * 2))
+            bounds = [num_pages * i // num_chunks for i in range(num_chunks + 1)]
+            # Spawn rather than fork: the Streamlit server is multi-threaded and
+            # forking it can deadlock the children
+            with ProcessPoolExecutor(
+                max_workers=min(num_chunks, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_pdf_worker,
+                initargs=(source,),
+            ) as pool:
+                chunks = pool.map(_extract_pages, bounds[:-1], bounds[1:])
+                return [text for chunk in chunks for text in chunk]
+
+        import pdfplumber
+        with pdfplumber.open(self._source()) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+
     # ==========================
     # MARKDOWN HANDLING
     # ==========================
     def parse_markdown(self):
-        """Parses Markdown using Regex mapping."""
+        """Parses Markdown using mistune, or Regex mapping as a fallback."""
         try:
-            with open(self.input_path, 'r', encoding='utf-8') as f:
-                md = f.read()
+            md = self._read_text()
 
-            # 1. Code Blocks (Handle first to avoid conflict)
-            def code_block_repl(match):
-                code = match.group(1)
-                return f"\\begin{{lstlisting}}\n{code}\n\\end{{lstlisting}}"
-            md = re.sub(r'```(.*?)```', code_block_repl, md, flags=re.DOTALL)
+            render_markdown = _markdown_renderer()
+            if render_markdown is not None:
+                self.content = render_markdown(md).rstrip()
+                return
 
-            # 2. Inline Code
-            md = re.sub(r'`([^`]+)`', r'\\texttt{\1}', md)
-
-            # 3. Headers
-            md = re.sub(r'^# (.*)', r'\\section{\1}', md, flags=re.MULTILINE)
-            md = re.sub(r'^## (.*)', r'\\subsection{\1}', md, flags=re.MULTILINE)
-            md = re.sub(r'^### (.*)', r'\\subsubsection{\1}', md, flags=re.MULTILINE)
-
-            # 4. Bold / Italic
-            md = re.sub(r'\*\*(.*?)\*\*', r'\\textbf{\1}', md)
-            md = re.sub(r'\*(.*?)\*', r'\\textit{\1}', md)
+            # 1-4. Code blocks, inline code, headers, bold / italic
+            for pattern, repl in _MD_PIPELINE:
+                md = pattern.sub(repl, md)
 
             # 5. Lists (Simple unordered)
             # This is a basic conversion; nested lists are complex in regex
             lines = md.split('\n')
             in_list = False
             processed_lines = []
+            # Bind hot lookups locally; this loop runs once per line
+            match_item = _LIST_LINE_RE.match
+            append = processed_lines.append
             
             for line in lines:
-                if re.match(r'^\s*-\s+', line):
-                    content = re.sub(r'^\s*-\s+', '', line)
+                item = match_item(line)
+                if item:
                     if not in_list:
-                        processed_lines.append(r'\begin{itemize}')
+                        append(r'\begin{itemize}')
                         in_list = True
-                    processed_lines.append(f'\\item {content}')
+                    append(f'\\item {line[item.end():]}')
                 else:
                     if in_list:
-                        processed_lines.append(r'\end{itemize}')
+                        append(r'\end{itemize}')
                         in_list = False
-                    processed_lines.append(line)
+                    append(line)
             
-            if in_list: processed_lines.append(r'\end{itemize}')
+            if in_list: append(r'\end{itemize}')
             md = "\n".join(processed_lines)
 
             # 6. Paragraphs (Double newlines)
@@ -252,8 +673,7 @@ class LatexConverter:
     def parse_txt(self):
         """Parses Plain Text."""
         try:
-            with open(self.input_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = self._read_text()
             
             # Escape and preserve paragraphs
             escaped = self._escape_latex(text)
@@ -264,11 +684,8 @@ class LatexConverter:
     # ==========================
     # MAIN LOGIC
     # ==========================
-    def convert(self):
-        ext = os.path.splitext(self.input_path)[1].lower()
-        
-        print(f"Detected file type: {ext}")
-        
+    def parse(self, ext):
+        """Parses the input file into self.content based on its extension."""
         if ext == '.docx':
             self.parse_docx()
         elif ext == '.pdf':
@@ -280,13 +697,146 @@ class LatexConverter:
         else:
             raise ValueError(f"Unsupported file type: {ext}")
 
-        full_document = f"{self._get_preamble()}\n\n{self.content}\n\n{self._get_postamble()}"
+    def _load_content(self):
+        ext = os.path.splitext(self.input_path)[1].lower()
         
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(full_document)
+        print(f"Detected file type: {ext}")
+        
+        # The body depends only on the input file, so reuse it across conversions
+        if self.data is not None:
+            digest = hashlib.blake2b(self.data, digest_size=20).hexdigest()
+        else:
+            digest = _file_digest(self.input_path)
+        self.content = _parse_cached(self, digest, ext)
+
+    def convert_to_string(self):
+        """Converts the input and returns the full LaTeX document."""
+        self._load_content()
+        return f"{self._get_preamble()}\n\n{self.content}\n\n{self._get_postamble()}"
+
+    def convert(self):
+        self._load_content()
+
+        # Write the parts in sequence rather than assembling a full copy in memory
+        with open(self.output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(self._get_preamble())
+            f.write("\n\n")
+            f.write(self.content)
+            f.write("\n\n")
+            f.write(self._get_postamble())
         
         print(f"Conversion successful! Output saved to: {self.output_path}")
 
+def _file_digest(path):
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _parser_backend(ext):
+    """Names the library (and its version) that parses `ext`, since the body
+    depends on both."""
+    if ext == '.md':
+        mistune = _import_mistune()
+        return f"mistune-{mistune.__version__}" if mistune is not None else 'regex'
+    if ext == '.pdf':
+        fitz = _import_fitz()
+        if fitz is not None:
+            return f"fitz-{getattr(fitz, 'VersionBind', 'unknown')}"
+        import pdfplumber
+        return f"plumber-{pdfplumber.__version__}"
+    return 'std'
+
+def _parse_cached(converter, digest, ext):
+    """Returns the parsed LaTeX body for a file, using the in-memory and on-disk caches."""
+    key = (digest, ext, _parser_backend(ext))
+    with _BODY_CACHE_LOCK:
+        if key in _BODY_CACHE:
+            _BODY_CACHE.move_to_end(key)
+            return _BODY_CACHE[key]
+
+    # Uploads are kept off disk; only files converted from a path are persisted
+    if converter.data is not None:
+        converter.parse(ext)
+        body = converter.content
+    else:
+        body = _parse_with_disk_cache(converter, key)
+
+    with _BODY_CACHE_LOCK:
+        _BODY_CACHE[key] = body
+        if len(_BODY_CACHE) > _BODY_CACHE_SIZE:
+            _BODY_CACHE.popitem(last=False)
+    return body
+
+def _parse_with_disk_cache(converter, key):
+    digest, ext, backend = key
+    cache_path = os.path.join(_CACHE_DIR, f"{digest}.{backend}{ext}.tex")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            body = f.read()
+    except OSError:
+        pass
+    else:
+        # Refresh the mtime so pruning drops the least recently used entries
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return body
+
+    converter.parse(ext)
+
+    # The disk cache is best-effort; an unwritable cache dir is not an error.
+    # Entries are written to a temp file and renamed into place so readers
+    # never see a partial body.
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(converter.content)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        _prune_disk_cache()
+    except OSError:
+        pass
+    return converter.content
+
+def _prune_disk_cache():
+    """Drops expired caches from other source versions, then expired and
+    excess entries of the current one."""
+    now = time.time()
+    # Another copy of the module (run.py vs latex_converter.py) may be using a
+    # sibling folder, so only remove folders nothing has written to lately
+    for name in os.listdir(_CACHE_ROOT):
+        path = os.path.join(_CACHE_ROOT, name)
+        try:
+            if path != _CACHE_DIR and os.path.isdir(path) and now - os.path.getmtime(path) > _CACHE_MAX_AGE:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+    entries = []
+    for entry in os.scandir(_CACHE_DIR):
+        try:
+            mtime = entry.stat().st_mtime
+            if now - mtime > _CACHE_MAX_AGE:
+                os.remove(entry.path)
+            elif entry.name.endswith('.tex'):
+                entries.append((mtime, entry.path))
+        except OSError:
+            pass
+
+    entries.sort(reverse=True)
+    for _, path in entries[_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 def main():
     parser = argparse.ArgumentParser(description="Convert DOCX/PDF/MD/TXT to LaTeX.")
     